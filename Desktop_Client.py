@@ -1,9 +1,62 @@
+from __future__ import annotations
+
+import bisect
 import tkinter as tk
 from tkinter import messagebox, simpledialog, ttk, filedialog
 import os
-from typing import Dict, Set, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING
 import configparser
 
+if TYPE_CHECKING:
+    from typing import Dict, Optional, Set
+
+# How many note bodies to keep in memory at once
+_BODY_CACHE_CAP = 64
+
+# Pause (ms) after the last keystroke before the search filter runs
+_SEARCH_DEBOUNCE_MS = 80
+
+# Deletes characters that are invalid in note filenames
+_INVALID_TITLE_CHARS = str.maketrans('', '', '\\/:*?"<>|')
+
+# Keysyms that cannot change the search query and should not trigger filtering
+_MODIFIER_KEYSYMS = frozenset({
+    'Shift_L', 'Shift_R', 'Control_L', 'Control_R',
+    'Alt_L', 'Alt_R', 'Caps_Lock', 'Num_Lock',
+    'Super_L', 'Super_R', 'Meta_L', 'Meta_R',
+})
+
+@lru_cache(maxsize=2)
+def _palette(dark: bool) -> Dict[str, str]:
+    """Return the color palette for a mode, built once and reused."""
+    if dark:
+        return {'bg': "#2E2E2E", 'fg': "#FFFFFF",
+                'field': "#3B3B3B", 'select': "#005BBA"}
+    return {'bg': "#F5F5F5", 'fg': "#000000",
+            'field': "#E0E0E0", 'select': "#007BFF"}
+
+
+@lru_cache(maxsize=1)
+def _about_text() -> str:
+    """Build the About dialog text once."""
+    return (
+        "Markdown Note-Taking App\n"
+        "Version 2.0\n\n"
+        "Features:\n"
+        "- Notes saved as Markdown (.md) files\n"
+        "- Customizable storage location\n"
+        "- Pinned notes support\n"
+        "- Dark/light mode\n"
+        "- Search functionality\n\n"
+        "Keyboard Shortcuts:\n"
+        "Ctrl+N: New note\n"
+        "Ctrl+S: Save note\n"
+        "Ctrl+O: Set notes location"
+    )
+
+
 class MarkdownNoteApp:
     def __init__(self, root: tk.Tk):
         self.root = root
@@ -12,81 +65,214 @@ class MarkdownNoteApp:
         self.pinned_notes: Set[str] = set()
         self.dark_mode = False
         self.current_note = None
-        self.notes: Dict[str, str] = {}
+        # Maps title -> body; None means the body has not been read yet
+        self.notes: Dict[str, Optional[str]] = {}
+        self._pending_saves: Set[str] = set()
+        self._flush_job: Optional[str] = None
+        self._body_lru: OrderedDict = OrderedDict()
+        # None marks the sorted order stale; rebuilt lazily by update_list
+        self._sorted_titles: Optional[list] = None
+        self._display_colors: list = []
+        self._visible_titles: list = []
+        self._recolor_job: Optional[str] = None
+        self._title_lower: Dict[str, str] = {}
+        self._search_job: Optional[str] = None
+        # Sorted (lowercase title, title) pairs answering prefix queries
+        # via bisect; set prefix_search False to match anywhere in titles
+        self._search_pairs: list = []
+        self.prefix_search = True
+        self._text_dirty = False
+        self._text_widgets: Dict[str, tk.Text] = {}
+        self._dirty_titles: Set[str] = set()
+        self._selected_title: Optional[str] = None
         
         # Load configuration
         self.config = configparser.ConfigParser()
         self.load_config()
-        
+
+        # One mkdir the kernel fast-paths when the directory exists,
+        # instead of a stat + mkdir pair on every directory scan
+        try:
+            os.makedirs(self.notes_path, exist_ok=True)
+        except OSError as e:
+            messagebox.showerror("Error", f"Failed to create notes directory: {e}")
+
         self.setup_ui()
         self.load_notes()
         self.update_list()
     
     def load_config(self) -> None:
         """Load or create configuration file."""
+        self._config_dirty = False
         self.config.read(self.config_file)
-        
+
         if not self.config.has_section('Settings'):
+            # Only a synthesized default needs to reach disk
             self.config.add_section('Settings')
             self.config.set('Settings', 'notes_path', os.getcwd())
+            self._config_dirty = True
             self.save_config()
-        
-        self.notes_path = self.config.get('Settings', 'notes_path', fallback=os.getcwd())
+
+        # Materialize the settings into a plain dict; configparser is only
+        # touched again when a value needs to be written back
+        self._settings = dict(self.config['Settings'])
+        self.notes_path = self._settings.get('notes_path', os.getcwd())
 
     def save_config(self) -> None:
-        """Save configuration to file."""
-        with open(self.config_file, 'w') as configfile:
+        """Save configuration to file atomically, only if it changed."""
+        if not self._config_dirty:
+            return
+        tmp_file = self.config_file + '.tmp'
+        with open(tmp_file, 'w') as configfile:
             self.config.write(configfile)
+        os.replace(tmp_file, self.config_file)
+        self._config_dirty = False
 
     def set_notes_path(self) -> None:
         """Set a new path for saving notes."""
         new_path = filedialog.askdirectory(initialdir=self.notes_path)
-        if new_path:
-            self.notes_path = new_path
-            self.config.set('Settings', 'notes_path', new_path)
-            self.save_config()
-            self.load_notes()
-            self.update_list()
+        if not new_path:
+            return
+        # Re-picking the current directory would be an expensive no-op
+        if os.path.normpath(new_path) == os.path.normpath(self.notes_path):
+            return
+
+        # Flush pending writes into the directory they belong to
+        if self._flush_job is not None:
+            self.root.after_cancel(self._flush_job)
+        self._flush()
+
+        self.notes_path = new_path
+        self._settings['notes_path'] = new_path
+        self.config.set('Settings', 'notes_path', new_path)
+        self._config_dirty = True
+        self.save_config()
+        self.load_notes()
+        self.update_list()
 
     def get_note_path(self, title: str) -> str:
         """Get full path for a note file."""
         return os.path.join(self.notes_path, f"{title}{self.default_extension}")
 
     def load_notes(self) -> None:
-        """Load notes from markdown files in the notes directory."""
+        """Index markdown files in the notes directory; bodies load on demand."""
         self.notes = {}
         self.pinned_notes = set()
-        
+        self._body_lru.clear()
+        self._pending_saves.clear()
+        self._dirty_titles.clear()
+        self._selected_title = None
+        self.current_note = None
+
+        # Pooled editors belong to the previous directory's notes
+        if self._text_widgets:
+            if self.text_area is not self._blank_text:
+                self._show_text_widget(self._blank_text)
+            for widget in self._text_widgets.values():
+                widget.destroy()
+            self._text_widgets.clear()
+            self.save_button.config(state=tk.DISABLED)
+
         try:
-            if not os.path.exists(self.notes_path):
-                os.makedirs(self.notes_path)
-                
-            for filename in os.listdir(self.notes_path):
-                if filename.endswith(self.default_extension):
-                    title = filename[:-len(self.default_extension)]
+            with os.scandir(self.notes_path) as entries:
+                for entry in entries:
+                    if not (entry.name.endswith(self.default_extension)
+                            and entry.is_file()):
+                        continue
+                    title = entry.name[:-len(self.default_extension)]
                     try:
-                        with open(os.path.join(self.notes_path, filename), 'r', encoding='utf-8') as file:
-                            content = file.read()
-                            self.notes[title] = content
-                            
-                            # Check if this is a pinned note (first line contains #pinned)
-                            if content.startswith("#pinned\n"):
+                        # Only the first 8 bytes are needed to detect pinned
+                        # notes; the body is read lazily when selected.
+                        with open(entry.path, 'rb') as file:
+                            if file.read(8) == b"#pinned\n":
                                 self.pinned_notes.add(title)
-                    except (IOError, UnicodeDecodeError) as e:
-                        print(f"Error loading note {filename}: {e}")
+                        self.notes[title] = None
+                    except IOError as e:
+                        print(f"Error loading note {entry.name}: {e}")
+        except FileNotFoundError:
+            os.makedirs(self.notes_path, exist_ok=True)
         except OSError as e:
             messagebox.showerror("Error", f"Failed to access notes directory: {e}")
 
+        self._title_lower = {t: t.lower() for t in self.notes}
+        self._search_pairs = sorted(
+            (lower, title) for title, lower in self._title_lower.items()
+        )
+        self._sorted_titles = None
+
+    def _touch_body(self, title: str) -> None:
+        """Mark a body as recently used, evicting the oldest beyond the cap."""
+        lru = self._body_lru
+        lru[title] = None
+        lru.move_to_end(title)
+        if len(lru) > _BODY_CACHE_CAP:
+            for old in list(lru):
+                if len(lru) <= _BODY_CACHE_CAP:
+                    break
+                # Never drop the body just touched, one awaiting a flush,
+                # or one whose buffer holds unsaved edits
+                if (old == title or old in self._pending_saves
+                        or old in self._dirty_titles):
+                    continue
+                widget = self._text_widgets.get(old)
+                if widget is not None and widget is self.text_area:
+                    continue
+                del lru[old]
+                self.notes[old] = None
+                # A clean pooled editor is reconstructable from disk, so
+                # evict it along with the body it duplicates
+                if widget is not None:
+                    del self._text_widgets[old]
+                    widget.destroy()
+
+    def _get_body(self, title: str) -> str:
+        """Return a note's body, reading it from disk on first access."""
+        body = self.notes.get(title)
+        if body is None:
+            try:
+                with open(self.get_note_path(title), 'r', encoding='utf-8') as file:
+                    body = file.read()
+            except (IOError, UnicodeDecodeError) as e:
+                messagebox.showerror("Error", f"Failed to load note: {e}")
+                body = ""
+            self.notes[title] = body
+        self._touch_body(title)
+        return body
+
     def save_note_to_file(self, title: str, content: str) -> bool:
-        """Save a single note to file."""
+        """Save a single note to file atomically."""
+        path = self.get_note_path(title)
+        tmp_path = path + '.tmp'
         try:
-            with open(self.get_note_path(title), 'w', encoding='utf-8') as file:
+            with open(tmp_path, 'w', encoding='utf-8') as file:
                 file.write(content)
+            os.replace(tmp_path, path)
             return True
         except IOError as e:
             messagebox.showerror("Error", f"Failed to save note: {e}")
             return False
 
+    def schedule_save(self, title: str) -> None:
+        """Queue a note for saving, coalescing bursts into one flush."""
+        self._pending_saves.add(title)
+        if self._flush_job is None:
+            self._flush_job = self.root.after(500, self._flush)
+
+    def _flush(self) -> None:
+        """Write all pending notes to disk."""
+        self._flush_job = None
+        for title in self._pending_saves:
+            if title in self.notes:
+                self.save_note_to_file(title, self.notes[title])
+        self._pending_saves.clear()
+
+    def on_close(self) -> None:
+        """Flush pending saves before closing the window."""
+        if self._flush_job is not None:
+            self.root.after_cancel(self._flush_job)
+        self._flush()
+        self.root.destroy()
+
     def add_note(self) -> None:
         """Add a new note."""
         title = simpledialog.askstring("New Note", "Enter note title:")
@@ -94,7 +280,7 @@ class MarkdownNoteApp:
             return
             
         # Remove invalid characters from filename
-        safe_title = "".join(c for c in title if c not in '\\/:*?"<>|')
+        safe_title = title.translate(_INVALID_TITLE_CHARS)
         if safe_title != title:
             messagebox.showwarning("Warning", "Removed invalid characters from note title")
             
@@ -103,109 +289,288 @@ class MarkdownNoteApp:
             return
             
         self.notes[safe_title] = ""
+        self._touch_body(safe_title)
+        self._title_lower[safe_title] = safe_title.lower()
+        bisect.insort(self._search_pairs, (self._title_lower[safe_title], safe_title))
+        if self._sorted_titles is not None:
+            bisect.insort(self._sorted_titles, safe_title, key=self._sort_key)
         if self.save_note_to_file(safe_title, ""):
             self.update_list()
             self.listbox.selection_clear(0, tk.END)
-            self.listbox.selection_set(tk.END)
+            # Highlight the row the note actually sorted into, not the last one
+            self.listbox.selection_set(self._visible_titles.index(safe_title))
+            self._selected_title = safe_title
             self.load_selected_note()
 
     def delete_note(self) -> None:
         """Delete the selected note."""
-        selected = self.listbox.curselection()
-        if not selected:
+        title = self._selected_title
+        if title is None:
             return
-            
-        title = self.listbox.get(selected[0])
+
         if not messagebox.askyesno("Delete", f"Delete '{title}'?"):
             return
             
         try:
             os.remove(self.get_note_path(title))
+            # Only drop the queued write once the file is really gone
+            self._pending_saves.discard(title)
             if title in self.pinned_notes:
                 self.pinned_notes.remove(title)
             del self.notes[title]
+            self._search_pairs.remove((self._title_lower[title], title))
+            del self._title_lower[title]
+            if self._sorted_titles is not None:
+                self._sorted_titles.remove(title)
+            self._dirty_titles.discard(title)
+            self._body_lru.pop(title, None)
+            self._selected_title = None
             self.update_list()
-            self.text_area.delete("1.0", tk.END)
+            widget = self._text_widgets.pop(title, None)
+            if widget is not None:
+                if widget is self.text_area:
+                    self._show_text_widget(self._blank_text)
+                widget.destroy()
             self.current_note = None
+            self._text_dirty = False
             self.save_button.config(state=tk.DISABLED)
         except OSError as e:
             messagebox.showerror("Error", f"Failed to delete note: {e}")
 
-    def update_list(self, filter_text: str = "") -> None:
-        """Update the notes list with optional filtering."""
-        self.listbox.delete(0, tk.END)
-        
-        # Sort notes with pinned notes first, then alphabetically
-        sorted_notes = sorted(
+    def _sort_key(self, title: str):
+        """Sort key placing pinned notes first, then alphabetical."""
+        return (title not in self.pinned_notes, self._title_lower[title])
+
+    def _rebuild_sorted_titles(self) -> None:
+        """Re-sort note titles: pinned notes first, then alphabetically.
+
+        Only needed when pin state changes or the whole collection is
+        reloaded; single adds and deletes are handled incrementally.
+        """
+        # Snapshot the pinned set and bind lookups as defaults so the key
+        # function runs on locals instead of attribute loads per title.
+        pinned = frozenset(self.pinned_notes)
+        self._sorted_titles = sorted(
             self.notes.keys(),
-            key=lambda x: (x not in self.pinned_notes, x.lower())
-        
-        for title in sorted_notes:
-            if filter_text.lower() in title.lower():
-                self.listbox.insert(tk.END, title)
-                if title in self.pinned_notes:
-                    self.listbox.itemconfig(tk.END, {'fg': 'blue'})
+            key=lambda t, p=pinned, l=self._title_lower: (t not in p, l[t])
+        )
 
-    def load_selected_note(self) -> None:
-        """Load the selected note into the text area."""
+    def update_list(self, filter_text: str = "") -> None:
+        """Update the notes list, touching only the rows that changed."""
+        if self._sorted_titles is None:
+            self._rebuild_sorted_titles()
+
+        filter_lower = filter_text.lower()
+        if filter_lower and self.prefix_search:
+            # O(log N + k) window over the sorted index, re-sorted into
+            # the pinned-first display order (k is the match count)
+            lo = bisect.bisect_left(self._search_pairs, (filter_lower,))
+            hi = bisect.bisect_left(self._search_pairs, (filter_lower + '\uffff',))
+            desired = sorted((t for _, t in self._search_pairs[lo:hi]),
+                             key=self._sort_key)
+        else:
+            desired = [t for t in self._sorted_titles
+                       if filter_lower in self._title_lower[t]]
+        # Every listbox mutation goes through this method, so the cached
+        # display list mirrors the widget without a Tcl round-trip.
+        current = self._visible_titles
+
+        # A cached selection that is no longer displayed is no selection
+        if self._selected_title is not None and self._selected_title not in desired:
+            self._selected_title = None
+
+        # Trim the common prefix and suffix so only the differing middle
+        # is deleted and reinserted.
+        start = 0
+        limit = min(len(desired), len(current))
+        while start < limit and desired[start] == current[start]:
+            start += 1
+        end_d, end_c = len(desired), len(current)
+        while end_d > start and end_c > start and desired[end_d - 1] == current[end_c - 1]:
+            end_d -= 1
+            end_c -= 1
+
+        if end_c > start:
+            self.listbox.delete(start, end_c - 1)
+        if end_d > start:
+            # One variadic insert is a single Tcl call for the whole chunk
+            self.listbox.insert(start, *desired[start:end_d])
+
+        # Tk drops the visual selection when the selected row passes
+        # through the rewritten middle; re-anchor it at its new index
+        if self._selected_title is not None and (end_c > start or end_d > start):
+            self.listbox.selection_clear(0, tk.END)
+            self.listbox.selection_set(desired.index(self._selected_title))
+
+        # Keep the applied-color cache aligned with the structural edit;
+        # freshly inserted rows start out with the default foreground.
+        self._display_colors[start:end_c] = \
+            [self.listbox.cget('fg')] * (end_d - start)
+        self._visible_titles = desired
+
+        # Recolor once Tk has committed the inserts in one layout pass
+        if self._recolor_job is None:
+            self._recolor_job = self.root.after_idle(self._apply_row_colors)
+
+    def _apply_row_colors(self) -> None:
+        """Reconcile pinned-row colors, touching only rows that changed."""
+        self._recolor_job = None
+        default_fg = self.listbox.cget('fg')
+        new_colors = ['blue' if t in self.pinned_notes else default_fg
+                      for t in self._visible_titles]
+        old_colors = self._display_colors
+        for i, color in enumerate(new_colors):
+            if old_colors[i] != color:
+                self.listbox.itemconfig(i, fg=color)
+        self._display_colors = new_colors
+
+    def _make_text_widget(self) -> tk.Text:
+        """Create a Text editor wired to the shared scrollbar and bindings."""
+        p = _palette(self.dark_mode)
+        widget = tk.Text(
+            self._text_frame,
+            wrap=tk.WORD,
+            bg=p['field'],
+            fg=p['fg'],
+            insertbackground=p['fg'],
+            font=("Consolas", 12),  # Monospaced font better for markdown
+            yscrollcommand=self._text_scrollbar.set
+        )
+        widget.edit_modified(False)
+        widget.bind("<<Modified>>", self._on_text_modified)
+        return widget
+
+    def _show_text_widget(self, widget: tk.Text) -> None:
+        """Swap the visible editor widget in place of the current one."""
+        if widget is self.text_area:
+            return
+        self.text_area.pack_forget()
+        self.text_area = widget
+        widget.pack(fill=tk.BOTH, expand=True)
+        self._text_scrollbar.config(command=widget.yview)
+
+    def _on_listbox_select(self, event=None) -> None:
+        """Cache the selected title once per selection event."""
         selected = self.listbox.curselection()
-        if not selected:
+        self._selected_title = self.listbox.get(selected[0]) if selected else None
+        if self._selected_title is not None:
+            self.load_selected_note()
+
+    def load_selected_note(self) -> None:
+        """Show the selected note's editor, creating it on first access."""
+        title = self._selected_title
+        if title is None:
             return
-            
-        title = self.listbox.get(selected[0])
+
+        # Remember unsaved edits on the note being left behind
+        if self.current_note is not None and self._text_dirty:
+            self._dirty_titles.add(self.current_note)
+
         self.current_note = title
-        self.text_area.delete("1.0", tk.END)
-        self.text_area.insert(tk.END, self.notes[title])
+        widget = self._text_widgets.get(title)
+        if widget is None:
+            widget = self._make_text_widget()
+            widget.insert(tk.END, self._get_body(title))
+            # Populating the widget is not a user edit
+            widget.edit_modified(False)
+            self._text_widgets[title] = widget
+        self._show_text_widget(widget)
+        self._text_dirty = title in self._dirty_titles
         self.save_button.config(state=tk.NORMAL)
 
+    def _on_text_modified(self, event=None) -> None:
+        """Record edits so save_note can skip clean buffers."""
+        widget = event.widget if event is not None else self.text_area
+        if widget.edit_modified():
+            if widget is self.text_area:
+                self._text_dirty = True
+            # Re-arm the widget's flag so the next edit fires again
+            widget.edit_modified(False)
+
     def save_note(self) -> None:
         """Save the current note."""
-        if not self.current_note:
+        if not self.current_note or not self._text_dirty:
             return
-            
+
         content = self.text_area.get("1.0", tk.END).strip()
+        self._text_dirty = False
+        self._dirty_titles.discard(self.current_note)
+        if content == self.notes.get(self.current_note):
+            return
+
         self.notes[self.current_note] = content
-        
-        if self.save_note_to_file(self.current_note, content):
-            # Update pinned status based on content
-            if content.startswith("#pinned\n"):
-                self.pinned_notes.add(self.current_note)
-            elif self.current_note in self.pinned_notes:
-                self.pinned_notes.remove(self.current_note)
-            
-            self.update_list()
+        self._touch_body(self.current_note)
+        self.schedule_save(self.current_note)
+
+        # Update pinned status based on content
+        was_pinned = self.current_note in self.pinned_notes
+        if content.startswith("#pinned\n"):
+            self.pinned_notes.add(self.current_note)
+        elif was_pinned:
+            self.pinned_notes.remove(self.current_note)
+
+        # Saving only disturbs the order when the pin status flipped
+        if (self.current_note in self.pinned_notes) != was_pinned:
+            self._sorted_titles = None
+        self.update_list()
+
+    def _init_styles(self) -> None:
+        """Create the light and dark ttk themes switched as a unit."""
+        self.style = ttk.Style()
+        for name, dark in (("notes-light", False), ("notes-dark", True)):
+            p = _palette(dark)
+            self.style.theme_create(name, parent="clam", settings={
+                "TFrame": {"configure": {"background": p['bg']}},
+                "TLabel": {"configure": {"background": p['bg'],
+                                         "foreground": p['fg']}},
+                "TButton": {"configure": {"background": p['bg'],
+                                          "foreground": p['fg']}},
+                "TEntry": {"configure": {"fieldbackground": p['field'],
+                                         "foreground": p['fg'],
+                                         "insertcolor": p['fg']}},
+                "TScrollbar": {"configure": {"background": p['bg'],
+                                             "troughcolor": p['field']}},
+            })
+        self.style.theme_use("notes-light")
 
     def toggle_dark_mode(self) -> None:
         """Toggle between dark and light mode."""
         self.dark_mode = not self.dark_mode
-        bg_color = "#2E2E2E" if self.dark_mode else "#F5F5F5"
-        fg_color = "#FFFFFF" if self.dark_mode else "#000000"
-        highlight_color = "#3B3B3B" if self.dark_mode else "#E0E0E0"
-        
-        widgets = [
-            self.text_area, self.listbox, self.search_entry, 
-            self.root, self.button_frame, self.status_bar
-        ]
-        
-        for widget in widgets:
-            if widget in [self.text_area, self.listbox, self.search_entry]:
-                widget.config(bg=highlight_color, fg=fg_color)
-                if hasattr(widget, 'insertbackground'):
-                    widget.config(insertbackground=fg_color)
-            else:
-                widget.config(bg=bg_color)
-        
-        # Update listbox selection colors
-        self.listbox.config(
-            selectbackground="#007BFF" if not self.dark_mode else "#005BBA",
-            selectforeground="#FFF"
-        )
-        
-        # Update status bar colors
-        self.status_bar.config(
-            bg=bg_color,
-            fg=fg_color
-        )
+        p = _palette(self.dark_mode)
+
+        # One theme switch restyles every ttk widget at once, and one
+        # palette call re-skins the classic widgets (root, status bar,
+        # menus) in a single pass inside the Tk engine.
+        self.style.theme_use("notes-dark" if self.dark_mode else "notes-light")
+        self.root.tk_setPalette(background=p['bg'], foreground=p['fg'])
+
+        # Only the field-colored classic widgets still need explicit
+        # colors; every pooled editor gets recolored, not just the
+        # visible one.
+        for text_widget in (self._blank_text, *self._text_widgets.values()):
+            text_widget.config(bg=p['field'], fg=p['fg'],
+                               insertbackground=p['fg'])
+        self.listbox.config(bg=p['field'], fg=p['fg'],
+                            selectbackground=p['select'],
+                            selectforeground='#FFF')
+
+        # Rows recolored against the old default keep their explicit
+        # foreground; reconcile them against the new palette
+        if self._recolor_job is None:
+            self._recolor_job = self.root.after_idle(self._apply_row_colors)
+
+    def schedule_search(self, event=None) -> None:
+        """Debounce search so filtering runs once typing pauses."""
+        if event is not None and event.keysym in _MODIFIER_KEYSYMS:
+            return
+        if self._search_job is not None:
+            self.root.after_cancel(self._search_job)
+        self._search_job = self.root.after(_SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _run_search(self) -> None:
+        """Run the pending debounced search."""
+        self._search_job = None
+        self.search_notes()
 
     def search_notes(self) -> None:
         """Filter notes based on search query."""
@@ -214,25 +579,68 @@ class MarkdownNoteApp:
 
     def toggle_pin(self) -> None:
         """Toggle pin status of selected note."""
-        selected = self.listbox.curselection()
-        if not selected:
+        title = self._selected_title
+        if title is None:
             return
-            
-        title = self.listbox.get(selected[0])
-        if title in self.pinned_notes:
-            self.pinned_notes.remove(title)
-            # Remove #pinned tag if it exists
-            if self.notes[title].startswith("#pinned\n"):
-                self.notes[title] = self.notes[title][8:]
-        else:
+
+        body = self._get_body(title)
+        pinning = title not in self.pinned_notes
+        changed = False
+        if pinning:
             self.pinned_notes.add(title)
             # Add #pinned tag if not present
-            if not self.notes[title].startswith("#pinned\n"):
-                self.notes[title] = f"#pinned\n{self.notes[title]}"
-        
-        self.save_note_to_file(title, self.notes[title])
+            if not body.startswith("#pinned\n"):
+                self.notes[title] = "#pinned\n" + body
+                changed = True
+        else:
+            self.pinned_notes.remove(title)
+            # Remove #pinned tag if it exists
+            if body.startswith("#pinned\n"):
+                self.notes[title] = body[8:]
+                changed = True
+
+        self._sync_pin_to_widget(title, pinning, changed)
+
+        # Only queue a write when the stored content actually changed
+        if changed:
+            self.schedule_save(title)
+        self._sorted_titles = None
         self.update_list()
 
+    def _sync_pin_to_widget(self, title: str, pinning: bool,
+                            changed: bool) -> None:
+        """Mirror a pin toggle into the note's pooled editor, if any.
+
+        A clean buffer is rewritten from the stored body so the next save
+        round-trips the header; a buffer with unsaved edits gets the
+        header toggled in place, keeping the edits and their dirty state.
+        """
+        widget = self._text_widgets.get(title)
+        if widget is None:
+            return
+
+        dirty = (title in self._dirty_titles
+                 or (widget is self.text_area and self._text_dirty))
+        if dirty:
+            text = widget.get("1.0", tk.END).strip()
+            if pinning and not text.startswith("#pinned\n"):
+                text = "#pinned\n" + text
+            elif not pinning and text.startswith("#pinned\n"):
+                text = text[8:]
+            else:
+                return
+            widget.delete("1.0", tk.END)
+            widget.insert(tk.END, text)
+            # The buffer still differs from the stored body: the
+            # <<Modified>> handler re-flags the visible widget and
+            # _dirty_titles keeps covering hidden ones
+        elif changed:
+            widget.delete("1.0", tk.END)
+            widget.insert(tk.END, self.notes[title])
+            widget.edit_modified(False)
+            if widget is self.text_area:
+                self._text_dirty = False
+
     def setup_ui(self) -> None:
         """Initialize the user interface."""
         self.root.title("Markdown Note-Taking App")
@@ -243,6 +651,7 @@ class MarkdownNoteApp:
         self.root.grid_rowconfigure(1, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
         
+        self._init_styles()
         self.create_menu()
         self.create_widgets()
         
@@ -251,35 +660,44 @@ class MarkdownNoteApp:
         self.root.bind('<Control-n>', lambda e: self.add_note())
         self.root.bind('<Control-o>', lambda e: self.set_notes_path())
 
+        # Make sure pending saves reach disk when the window closes
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
     def create_menu(self) -> None:
-        """Create the menu bar."""
+        """Create the menu bar from a declarative spec in one pass."""
+        menu_spec = (
+            ("File", (
+                ("New Note", self.add_note, "Ctrl+N"),
+                ("Save Note", self.save_note, "Ctrl+S"),
+                ("Set Notes Location", self.set_notes_path, "Ctrl+O"),
+                None,  # separator
+                ("Exit", self.on_close, None),
+            )),
+            ("Edit", (
+                ("Delete Note", self.delete_note, None),
+                ("Pin/Unpin Note", self.toggle_pin, None),
+            )),
+            ("View", (
+                ("Toggle Dark Mode", self.toggle_dark_mode, None),
+            )),
+            ("Help", (
+                ("About", self.show_about, None),
+            )),
+        )
+
         menu_bar = tk.Menu(self.root)
+        for label, items in menu_spec:
+            menu = tk.Menu(menu_bar, tearoff=0)
+            for item in items:
+                if item is None:
+                    menu.add_separator()
+                else:
+                    text, command, accelerator = item
+                    menu.add_command(label=text, command=command,
+                                     accelerator=accelerator)
+            menu_bar.add_cascade(label=label, menu=menu)
+        # Attach the fully built bar with a single config call
         self.root.config(menu=menu_bar)
-        
-        # File menu
-        file_menu = tk.Menu(menu_bar, tearoff=0)
-        file_menu.add_command(label="New Note", command=self.add_note, accelerator="Ctrl+N")
-        file_menu.add_command(label="Save Note", command=self.save_note, accelerator="Ctrl+S")
-        file_menu.add_command(label="Set Notes Location", command=self.set_notes_path, accelerator="Ctrl+O")
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
-        menu_bar.add_cascade(label="File", menu=file_menu)
-        
-        # Edit menu
-        edit_menu = tk.Menu(menu_bar, tearoff=0)
-        edit_menu.add_command(label="Delete Note", command=self.delete_note)
-        edit_menu.add_command(label="Pin/Unpin Note", command=self.toggle_pin)
-        menu_bar.add_cascade(label="Edit", menu=edit_menu)
-        
-        # View menu
-        view_menu = tk.Menu(menu_bar, tearoff=0)
-        view_menu.add_command(label="Toggle Dark Mode", command=self.toggle_dark_mode)
-        menu_bar.add_cascade(label="View", menu=view_menu)
-        
-        # Help menu
-        help_menu = tk.Menu(menu_bar, tearoff=0)
-        help_menu.add_command(label="About", command=self.show_about)
-        menu_bar.add_cascade(label="Help", menu=help_menu)
 
     def create_widgets(self) -> None:
         """Create and arrange all widgets."""
@@ -299,7 +717,7 @@ class MarkdownNoteApp:
         
         self.search_entry = ttk.Entry(search_frame, width=60)
         self.search_entry.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=5)
-        self.search_entry.bind('<KeyRelease>', lambda e: self.search_notes())
+        self.search_entry.bind('<KeyRelease>', self.schedule_search)
         
         search_button = ttk.Button(search_frame, text="Search", command=self.search_notes)
         search_button.pack(side=tk.RIGHT, padx=5)
@@ -329,26 +747,20 @@ class MarkdownNoteApp:
         )
         self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.config(command=self.listbox.yview)
-        self.listbox.bind("<<ListboxSelect>>", lambda e: self.load_selected_note())
-        
-        # Text area with scrollbar
-        text_frame = ttk.Frame(content_frame)
-        text_frame.grid(row=0, column=1, sticky="nsew")
-        
-        text_scrollbar = ttk.Scrollbar(text_frame)
-        text_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.listbox.bind("<<ListboxSelect>>", self._on_listbox_select)
         
-        self.text_area = tk.Text(
-            text_frame,
-            wrap=tk.WORD,
-            bg="#F5F5F5",
-            fg="#000",
-            insertbackground="#000",
-            font=("Consolas", 12),  # Monospaced font better for markdown
-            yscrollcommand=text_scrollbar.set
-        )
+        # Text area with scrollbar; one Text widget is pooled per note so
+        # switching notes swaps widgets instead of copying buffer contents
+        self._text_frame = ttk.Frame(content_frame)
+        self._text_frame.grid(row=0, column=1, sticky="nsew")
+
+        self._text_scrollbar = ttk.Scrollbar(self._text_frame)
+        self._text_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self._blank_text = self._make_text_widget()
+        self.text_area = self._blank_text
         self.text_area.pack(fill=tk.BOTH, expand=True)
-        text_scrollbar.config(command=self.text_area.yview)
+        self._text_scrollbar.config(command=self.text_area.yview)
         
         # Button frame
         self.button_frame = ttk.Frame(self.root, padding=10)
@@ -364,11 +776,13 @@ class MarkdownNoteApp:
         ]
         
         for i, (text, command) in enumerate(buttons):
-            btn = ttk.Button(self.button_frame, text=text, command=command)
+            # Pass the initial state at construction instead of a follow-up config
+            state = tk.DISABLED if text == "Save Note" else tk.NORMAL
+            btn = ttk.Button(self.button_frame, text=text, command=command,
+                             state=state)
             btn.grid(row=0, column=i, padx=5, sticky="ew")
             if text == "Save Note":
                 self.save_button = btn
-                self.save_button.config(state=tk.DISABLED)
         
         # Configure column weights for button frame
         for i in range(len(buttons)):
@@ -376,21 +790,7 @@ class MarkdownNoteApp:
 
     def show_about(self) -> None:
         """Show about dialog."""
-        about_text = (
-            "Markdown Note-Taking App\n"
-            "Version 2.0\n\n"
-            "Features:\n"
-            "- Notes saved as Markdown (.md) files\n"
-            "- Customizable storage location\n"
-            "- Pinned notes support\n"
-            "- Dark/light mode\n"
-            "- Search functionality\n\n"
-            "Keyboard Shortcuts:\n"
-            "Ctrl+N: New note\n"
-            "Ctrl+S: Save note\n"
-            "Ctrl+O: Set notes location"
-        )
-        messagebox.showinfo("About", about_text)
+        messagebox.showinfo("About", _about_text())
 
 if __name__ == "__main__":
     root = tk.Tk()